@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from nengo_spa.algebras.vtb_algebra import VtbAlgebra
 from nengo_spa.semantic_pointer import SemanticPointer
@@ -17,6 +18,19 @@ def test_is_valid_dimensionality():
     assert VtbAlgebra().is_valid_dimensionality(1)
     assert VtbAlgebra().is_valid_dimensionality(16)
     assert VtbAlgebra().is_valid_dimensionality(25)
+    assert VtbAlgebra().is_valid_dimensionality((2 ** 30 + 1) ** 2)
+    assert not VtbAlgebra().is_valid_dimensionality((2 ** 30 + 1) ** 2 - 1)
+    assert VtbAlgebra().is_valid_dimensionality(16.0)
+    assert VtbAlgebra().is_valid_dimensionality(np.float64(16))
+    assert VtbAlgebra().is_valid_dimensionality(np.int64(16))
+    assert not VtbAlgebra().is_valid_dimensionality(16.5)
+    assert not VtbAlgebra().is_valid_dimensionality(float("inf"))
+
+
+@pytest.mark.parametrize("d", [-1, 15, 16.5])
+def test_get_sub_d_invalid(d):
+    with pytest.raises(ValueError, match="square number"):
+        VtbAlgebra()._get_sub_d(d)
 
 
 def test_get_swapping_matrix(rng):
@@ -26,3 +40,47 @@ def test_get_swapping_matrix(rng):
 
     m = VtbAlgebra().get_swapping_matrix(64)
     assert np.allclose(VtbAlgebra().bind(a, b), np.dot(m, VtbAlgebra().bind(b, a)))
+
+
+def test_get_binding_matrix_swapped_inputs(rng):
+    gen = UnitLengthVectors(64, rng)
+    a = SemanticPointer(next(gen), algebra=VtbAlgebra()).v
+    b = SemanticPointer(next(gen), algebra=VtbAlgebra()).v
+
+    m = VtbAlgebra().get_binding_matrix(b, swap_inputs=True)
+    assert np.allclose(VtbAlgebra().bind(b, a), np.dot(m, a))
+
+
+@pytest.mark.parametrize(
+    "d, first_element", [(1, None), (4, None), (256, None), (4096, 1e-12)]
+)
+def test_make_unitary_orthogonal_rows(d, first_element, rng):
+    sub_d = int(np.sqrt(d))
+    a = next(UnitLengthVectors(d, rng))
+    if first_element is not None:
+        a[0] = first_element  # ill-conditioned leading block
+    m = VtbAlgebra().make_unitary(a).reshape((sub_d, sub_d))
+    assert np.allclose(np.dot(m, m.T), np.eye(sub_d) / sub_d, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "dtype, expected", [(np.int64, np.float64), (np.float32, np.float32)]
+)
+def test_make_unitary_dtype(dtype, expected):
+    a = np.arange(1, 17).astype(dtype)
+    assert VtbAlgebra().make_unitary(a).dtype == expected
+
+
+def test_make_unitary_singular():
+    a = np.zeros(16)
+    a[[0, 3, 9, 14]] = 0.5
+    with pytest.raises(np.linalg.LinAlgError):
+        VtbAlgebra().make_unitary(a)
+
+
+@pytest.mark.parametrize("d", [1, 16, 25])
+def test_identity_element(d):
+    sub_d = int(np.sqrt(d))
+    assert np.allclose(
+        VtbAlgebra().identity_element(d), np.eye(sub_d).flatten() / d ** 0.25
+    )
@@ -1,9 +1,34 @@
+import functools
+import math
+import operator
+
 import nengo
 import numpy as np
 
 from nengo_spa.algebras.base import AbstractAlgebra
 from nengo_spa.networks.vtb import VTB
 
+try:
+    from math import isqrt as _isqrt
+except ImportError:  # Python < 3.8
+
+    def _isqrt(n):
+        root = int(math.sqrt(n))
+        while root * root > n:
+            root -= 1
+        while (root + 1) * (root + 1) <= n:
+            root += 1
+        return root
+
+
+def _as_integral(d):
+    try:
+        return operator.index(d)
+    except TypeError:
+        if not float(d).is_integer():
+            return None
+        return int(d)
+
 
 class VtbAlgebra(AbstractAlgebra):
     r"""Vector-derived Transformation Binding (VTB) algebra.
@@ -67,27 +92,32 @@ class VtbAlgebra(AbstractAlgebra):
             *True*, if *d* is a valid vector dimensionality for the use with
             the algebra.
         """
-        if d < 1:
+        d = _as_integral(d)
+        if d is None or d < 1:
             return False
-        sub_d = np.sqrt(d)
+        sub_d = _isqrt(d)
         return sub_d * sub_d == d
 
     def _get_sub_d(self, d):
-        sub_d = int(np.sqrt(d))
-        if sub_d * sub_d != d:
+        d = _as_integral(d)
+        sub_d = _isqrt(d) if d is not None and d >= 0 else None
+        if sub_d is None or sub_d * sub_d != d:
             raise ValueError("Vector dimensionality must be a square number.")
         return sub_d
 
+    @functools.lru_cache(maxsize=None)
+    def _bind_scale(self, d):
+        return math.sqrt(self._get_sub_d(d))
+
     def make_unitary(self, v):
         sub_d = self._get_sub_d(len(v))
-        m = np.array(v.reshape((sub_d, sub_d)))
+        m = np.array(v, dtype=np.result_type(v, np.float32)).reshape((sub_d, sub_d))
         for i in range(1, sub_d):
             y = -np.dot(m[:i, i:], m[i, i:])
             A = m[:i, :i]
             m[i, :i] = np.linalg.solve(A, y)
-        m /= np.linalg.norm(m, axis=1)[:, None]
-        m /= np.sqrt(sub_d)
-        return m.flatten()
+        m *= 1.0 / (np.sqrt(sub_d) * np.linalg.norm(m, axis=1))[:, None]
+        return m.ravel()
 
     def superpose(self, a, b):
         return a + b
@@ -96,18 +126,25 @@ class VtbAlgebra(AbstractAlgebra):
         d = len(a)
         if len(b) != d:
             raise ValueError("Inputs must have same length.")
-        m = self.get_binding_matrix(b)
-        return np.dot(m, a)
+        sub_d = self._get_sub_d(d)
+        # Equivalent to np.dot(self.get_binding_matrix(b), a), but avoids
+        # constructing the block-diagonal (d, d) binding matrix.
+        m = np.dot(a.reshape((sub_d, sub_d)), b.reshape((sub_d, sub_d)).T)
+        return self._bind_scale(d) * m.ravel()
 
     def invert(self, v):
         sub_d = self._get_sub_d(len(v))
         return v.reshape((sub_d, sub_d)).T.flatten()
 
     def get_binding_matrix(self, v, swap_inputs=False):
-        sub_d = self._get_sub_d(len(v))
-        m = np.sqrt(sub_d) * np.kron(np.eye(sub_d), v.reshape((sub_d, sub_d)))
+        d = len(v)
+        sub_d = self._get_sub_d(d)
+        block = self._bind_scale(d) * v.reshape((sub_d, sub_d))
+        m = np.zeros((d, d))
+        for i in range(sub_d):
+            m[i * sub_d : (i + 1) * sub_d, i * sub_d : (i + 1) * sub_d] = block
         if swap_inputs:
-            m = np.dot(self.get_swapping_matrix(len(v)), m)
+            m = m[self._get_inversion_perm(d)]
         return m
 
     def get_swapping_matrix(self, d):
@@ -127,8 +164,16 @@ class VtbAlgebra(AbstractAlgebra):
         return self.get_inversion_matrix(d)
 
     def get_inversion_matrix(self, d):
+        m = np.zeros((d, d))
+        m[np.arange(d), self._get_inversion_perm(d)] = 1.0
+        return m
+
+    @functools.lru_cache(maxsize=None)
+    def _get_inversion_perm(self, d):
         sub_d = self._get_sub_d(d)
-        return np.eye(d).reshape(d, sub_d, sub_d).T.reshape(d, d)
+        perm = np.arange(d).reshape((sub_d, sub_d)).T.flatten()
+        perm.setflags(write=False)
+        return perm
 
     def implement_superposition(self, n_neurons_per_d, d, n):
         node = nengo.Node(size_in=d)
@@ -144,7 +189,9 @@ class VtbAlgebra(AbstractAlgebra):
 
     def identity_element(self, d):
         sub_d = self._get_sub_d(d)
-        return (np.eye(sub_d) / d ** 0.25).flatten()
+        identity = np.zeros(d)
+        identity[:: sub_d + 1] = d ** -0.25
+        return identity
 
     def zero_element(self, d):
         """Return the zero element of dimensionality *d*.
@@ -21,22 +21,13 @@ def as_ast_node(obj):
     else:
         output = obj
 
-    try:
-        # Trying to create weakref on access of weak dict can raise TypeError
-        vocab = output_vocab_registry[output]
-    except (KeyError, TypeError):
-        if getattr(output, "size_out", 0) == 1:
-            return ModuleOutput(output, TScalar)
-        err = SpaTypeError("{} was not registered as a SPA output.".format(output))
-        err.__suppress_context__ = True
-        raise err
-    finally:
-        err = None  # prevent cyclic reference, traceback might reference this
-
-    if vocab is None:
+    node = getattr(output, "_spa_ast_node", None)
+    if node is not None:
+        return node
+    elif getattr(output, "size_out", 0) == 1:
         return ModuleOutput(output, TScalar)
     else:
-        return ModuleOutput(output, TVocabulary(vocab))
+        raise SpaTypeError("{} was not registered as a SPA output.".format(output))
 
 
 def as_sink(obj):
@@ -45,20 +36,11 @@ def as_sink(obj):
     else:
         input_ = obj
 
-    try:
-        # Trying to create weakref on access of weak dict can raise TypeError
-        vocab = input_vocab_registry[input_]
-    except (KeyError, TypeError):
-        err = SpaTypeError("{} was not registered as a SPA input.".format(input_))
-        err.__suppress_context__ = True
-        raise err
-    finally:
-        err = None  # prevent cyclic reference, traceback might reference this
-
-    if vocab is None:
-        return ModuleInput(input_, TScalar)
+    sink = getattr(input_, "_spa_sink", None)
+    if sink is not None:
+        return sink
     else:
-        return ModuleInput(input_, TVocabulary(vocab))
+        raise SpaTypeError("{} was not registered as a SPA input.".format(input_))
 
 
 class ModuleInput(object):
@@ -142,6 +124,23 @@ class SpaOperatorMixin(object):
     operator itself is delegated to the implementation provided by those nodes.
     """
 
+    # AST nodes of declared connectors, set by `.ConnectorRegistry`
+    _spa_ast_node = None
+    _spa_sink = None
+
+    def __reduce_ex__(self, protocol):
+        # Copies are not registered as connectors and must not reuse the
+        # cached AST nodes. Those are dropped from the state here because
+        # a __getstate__ defined in this mixin would be shadowed by the one of
+        # Nengo objects and networks.
+        reduced = super(SpaOperatorMixin, self).__reduce_ex__(protocol)
+        if len(reduced) > 2 and isinstance(reduced[2], dict):
+            state = dict(reduced[2])
+            state.pop("_spa_ast_node", None)
+            state.pop("_spa_sink", None)
+            reduced = reduced[:2] + (state,) + reduced[3:]
+        return reduced
+
     @staticmethod
     def __define_unary_op(op):
         def op_impl(self):
@@ -194,13 +193,29 @@ class ConnectorRegistry(object):
     in SPA rules. These substituted classes will be cached to use the same
     type instance where appropriate (i.e. two Nengo objects of identical type A
     will still be of identical type B after being declared as connectors and
-    B inherits from A and *SpaOperatorMixin*).
+    B inherits from A and *SpaOperatorMixin*). Objects that already support
+    the SPA operators (e.g., because they have been declared as a connector
+    before) keep their class.
+
+    The AST node representing the connector is created on declaration and
+    stored in the attribute *node_attr* of the connector. This allows
+    `.as_ast_node` and `.as_sink` to retrieve it without a registry lookup.
+
+    Parameters
+    ----------
+    node_type : type
+        AST node type to represent declared connectors, either `.ModuleInput`
+        or `.ModuleOutput`.
+    node_attr : str
+        Name of the attribute to store the AST node in.
     """
 
     _type_cache = {}
 
-    def __init__(self):
+    def __init__(self, node_type, node_attr):
         self._registry = weakref.WeakKeyDictionary()
+        self.node_type = node_type
+        self.node_attr = node_attr
 
     def __contains__(self, key):
         return key in self._registry
@@ -218,19 +233,22 @@ class ConnectorRegistry(object):
         vocab: Vocabulary
             Vocabulary to assign to the connector.
         """
-        try:
-            extended_type = self._type_cache[obj.__class__]
-        except KeyError:
-            extended_type = type(
-                "Connector<%s>" % (obj.__class__.__name__),
-                (obj.__class__, SpaOperatorMixin),
-                {},
-            )
-            self._type_cache[obj.__class__] = extended_type
-        obj.__class__ = extended_type
+        if not isinstance(obj, SpaOperatorMixin):
+            try:
+                extended_type = self._type_cache[obj.__class__]
+            except KeyError:
+                extended_type = type(
+                    "Connector<%s>" % (obj.__class__.__name__),
+                    (obj.__class__, SpaOperatorMixin),
+                    {},
+                )
+                self._type_cache[obj.__class__] = extended_type
+            obj.__class__ = extended_type
         self._registry[obj] = vocab
+        type_ = TScalar if vocab is None else TVocabulary(vocab)
+        setattr(obj, self.node_attr, self.node_type(obj, type_))
         return obj
 
 
-input_vocab_registry = ConnectorRegistry()
-output_vocab_registry = ConnectorRegistry()
+input_vocab_registry = ConnectorRegistry(ModuleInput, "_spa_sink")
+output_vocab_registry = ConnectorRegistry(ModuleOutput, "_spa_ast_node")
@@ -22,6 +22,8 @@ class _AutoConfig(object):
         self._cfg = cfg
 
     def __getattr__(self, name):
+        if name == "_cfg":  # not yet set when unpickling or copying
+            raise AttributeError(name)
         return getattr(self._cfg, name)
 
     def __getitem__(self, key):
@@ -106,11 +108,9 @@ class Network(nengo.Network, SupportDefaultsMixin, SpaOperatorMixin):
     _master_vocabs = weakref.WeakKeyDictionary()
     vocabs = VocabularyMapParam("vocabs", default=None, optional=False)
 
-    _input_types = {}
-    _output_types = {}
-
     def __init__(self, label=None, seed=None, add_to_container=None, vocabs=None):
         super(Network, self).__init__(label, seed, add_to_container)
+        self._auto_config = _AutoConfig(self._config)
         self.config.configures(Network)
 
         if vocabs is None:
@@ -132,7 +132,7 @@ class Network(nengo.Network, SupportDefaultsMixin, SpaOperatorMixin):
 
     @property
     def config(self):
-        return _AutoConfig(self._config)
+        return self._auto_config
 
     @classmethod
     def get_input_vocab(cls, obj):
@@ -193,6 +193,7 @@ def create_inhibit_node(net, strength=2.0, **kwargs):
         nengo.Connection(
             inhibit_node,
             e.neurons,
-            transform=-strength * np.ones((e.n_neurons, 1), **kwargs),
+            transform=np.broadcast_to(-strength, (e.n_neurons, 1)),
+            **kwargs
         )
     return inhibit_node
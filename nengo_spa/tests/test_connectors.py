@@ -2,7 +2,7 @@ import nengo
 import pytest
 
 import nengo_spa as spa
-from nengo_spa.connectors import as_ast_node
+from nengo_spa.connectors import as_ast_node, as_sink, SpaOperatorMixin
 from nengo_spa.exceptions import SpaTypeError
 
 
@@ -13,3 +13,51 @@ def test_as_ast_node_error(construct_obj):
     with spa.Network():
         with pytest.raises(SpaTypeError):
             as_ast_node(construct_obj())
+
+
+def test_declaring_connector_again_updates_cached_nodes():
+    with spa.Network() as model:
+        node = nengo.Node(size_in=16)
+        model.declare_input(node, spa.Vocabulary(16))
+        model.declare_output(node, spa.Vocabulary(16))
+        assert as_sink(node) is as_sink(node)
+        assert as_ast_node(node) is as_ast_node(node)
+
+        vocab = spa.Vocabulary(16)
+        model.declare_input(node, vocab)
+        model.declare_output(node, vocab)
+        assert as_sink(node).type.vocab is vocab
+        assert as_ast_node(node).type.vocab is vocab
+
+
+def test_copy_of_network_does_not_reuse_cached_nodes():
+    with spa.Network() as model:
+        model.state = spa.State(16)
+        as_ast_node(model.state)
+        as_sink(model.state)
+
+    state_copy = model.copy().networks[0]
+    with pytest.raises(SpaTypeError):
+        as_ast_node(state_copy)
+    with pytest.raises(SpaTypeError):
+        as_sink(state_copy)
+
+
+def test_declaring_connector_twice_extends_class_once():
+    with spa.Network() as model:
+        a = nengo.Node(size_in=16)
+        b = nengo.Node(size_in=16)
+        model.declare_input(a, None)
+        model.declare_output(a, None)
+        model.declare_input(b, None)
+    assert type(a) is type(b)
+    assert type(a).__bases__ == (nengo.Node, SpaOperatorMixin)
+
+
+def test_copy_of_connector_is_not_declared():
+    with spa.Network() as model:
+        node = nengo.Node(size_in=16)
+        model.declare_output(node, spa.Vocabulary(16))
+        node_copy = node.copy()
+        with pytest.raises(SpaTypeError):
+            as_ast_node(node_copy)
@@ -188,6 +188,17 @@ def test_create_inhibit_node(Simulator, plt):
     assert_allclose(sim.data[p][sim.trange() > 0.1], 0.0, atol=1e-3)
 
 
+def test_create_inhibit_node_connection_kwargs():
+    with nengo.Network() as model:
+        ea = nengo.networks.EnsembleArray(10, 3)
+        inhibit_node = create_inhibit_node(ea, synapse=0.05)
+
+    connections = [c for c in model.all_connections if c.pre is inhibit_node]
+    assert len(connections) == ea.n_ensembles
+    for c in connections:
+        assert c.synapse == nengo.Lowpass(0.05)
+
+
 def test_instance_config():
     with spa.Network() as net:
         ens = nengo.Ensemble(10, 1)
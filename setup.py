@@ -61,11 +61,11 @@ setup(
     zip_safe=True,
     include_package_data=True,
     setup_requires=["pytest-runner"] if testing else [] + [
-        "numpy>=1.8",
+        "numpy>=1.10",
     ],
     install_requires = [
         "nengo>=2.7,<4",
-        "numpy>=1.8",
+        "numpy>=1.10",
     ],
     extras_require = {
         "all": docs_require + optional_requires + tests_require,